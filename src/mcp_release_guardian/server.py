@@ -9,6 +9,9 @@ than raising an exception.
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
+import re
 import tomllib
 from pathlib import Path
 
@@ -21,33 +24,168 @@ mcp = FastMCP("mcp-release-guardian")
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Fast-path patterns for _detect_version: locate the [project] table header
+# and a double-quoted version assignment inside it without a full TOML parse.
+_PROJECT_HEADER_RE = re.compile(rb"(?m)^\[project\]\s*$")
+_PROJECT_VERSION_RE = re.compile(rb'(?m)^version\s*=\s*"([^"]+)"\s*(?:#.*)?$')
+
+# Candidate file names for the hygiene checks, in priority order. Built once
+# at import so each call only does frozenset membership tests against the
+# scandir snapshot.
+_PKG_CANDIDATES = ("pyproject.toml", "setup.cfg", "setup.py")
+_LICENSE_CANDIDATES = ("LICENSE", "LICENSE.txt", "LICENSE.md", "LICENSE.rst")
+_README_CANDIDATES = ("README.md", "README.rst", "README.txt", "README")
+
+# Full checklist markdown as one module-level template; rendering is a single
+# .format() call with the four variable pieces, no intermediate line list.
+_CHECKLIST_TEMPLATE = """\
+# Release Checklist — {tag}
+
+## Version alignment
+- [ ] Confirm version alignment: run `check_version_alignment` with `expected_tag={tag}`
+
+## Tests
+- [ ] Run tests: `{test_cmd}` — all must pass before tagging
+
+## Tag
+- [ ] Create and push git tag:
+      `git tag {tag} && git push origin {tag}`
+
+## Release notes
+- [ ] Update CHANGELOG / release notes with entries for {tag}
+
+## Adoption hooks
+- [ ] Verify adoption hooks are in place:
+  - Bug report template (.github/ISSUE_TEMPLATE/bug_report.yml): {bug_mark}
+  - CI workflows (.github/workflows/): {ci_mark}
+  - Confirm pinned issues are set if applicable"""
+
+
+@functools.lru_cache(maxsize=256)
+def _resolved(repo_path: str) -> str:
+    """Resolve a raw repo_path input to a canonical absolute path.
+
+    os.path.realpath is a thin wrapper over the libc resolver and skips the
+    Path-object overhead of Path.resolve(); the LRU means the per-component
+    lstat walk happens once per distinct input string per session.
+    """
+    return os.path.realpath(repo_path)
+
 
 def _detect_version(path: Path) -> str | None:
-    """Read pyproject.toml [project].version; return None if absent or unreadable."""
+    """Read pyproject.toml [project].version; return None if absent or unreadable.
+
+    Results are memoized per (path, mtime, size) so back-to-back tool calls in
+    the same release workflow skip re-reading an unchanged file.
+    """
     pyproject_path = path / "pyproject.toml"
-    if not pyproject_path.exists():
+    try:
+        st = os.stat(pyproject_path)
+    except OSError:
+        return None
+    return _parse_version(str(pyproject_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(pyproject_path: str, mtime_ns: int, size: int) -> str | None:
+    """Extract [project].version from a pyproject.toml snapshot.
+
+    A precompiled regex scan of the [project] section handles the common
+    double-quoted case without paying for a full tomllib parse; anything the
+    regex cannot resolve unambiguously falls back to tomllib.
+    """
+    try:
+        raw = Path(pyproject_path).read_bytes()
+    except OSError:
         return None
+
+    header = _PROJECT_HEADER_RE.search(raw)
+    if header is not None:
+        next_table = raw.find(b"\n[", header.end())
+        section = raw[header.end() : next_table if next_table != -1 else len(raw)]
+        match = _PROJECT_VERSION_RE.search(section)
+        if match is not None:
+            try:
+                return match.group(1).decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+
+    # Slow path: regex found no [project] version; let tomllib decide.
     try:
-        with open(pyproject_path, "rb") as fh:
-            data = tomllib.load(fh)
+        data = tomllib.loads(raw.decode("utf-8"))
         v = data.get("project", {}).get("version")
         return str(v) if v is not None else None
     except Exception:
         return None
 
 
+def _scan_names(path: Path) -> frozenset[str]:
+    """Entry names of a directory via one os.scandir pass.
+
+    Memoized per (path, mtime) — a directory's mtime changes whenever entries
+    are added or removed, so an unchanged mtime means the cached listing is
+    still valid. Returns an empty set when the directory is missing or
+    unreadable, so membership tests degrade to "not found" (fail-closed).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return frozenset()
+    return _scan_names_snapshot(str(path), st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_names_snapshot(path: str, mtime_ns: int) -> frozenset[str]:
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _has_bug_template(path: Path) -> bool:
+    """True if .github/ISSUE_TEMPLATE/bug_report.yml exists.
+
+    Shared by check_repo_hygiene and generate_release_checklist so the
+    back-to-back hygiene-then-checklist workflow hits the cached listings.
+    """
+    github_names = _scan_names(path / ".github")
+    return (
+        "ISSUE_TEMPLATE" in github_names
+        and "bug_report.yml" in _scan_names(path / ".github" / "ISSUE_TEMPLATE")
+    )
+
+
+def _has_ci_workflows(path: Path) -> bool:
+    """True if .github/workflows/ exists and is a directory."""
+    return "workflows" in _scan_names(path / ".github") and (
+        path / ".github" / "workflows"
+    ).is_dir()
+
+
 def _has_pytest(path: Path) -> bool:
-    """Return True if pytest is referenced in the repo's config files."""
-    if (path / "pytest.ini").exists():
+    """Return True if pytest is referenced in the repo's config files.
+
+    Scans config files as raw bytes in fixed-size chunks, so large files are
+    never fully loaded or UTF-8 decoded just to find one substring.
+    """
+    root_names = _scan_names(path)
+    if "pytest.ini" in root_names:
         return True
-    for candidate in ["pyproject.toml", "setup.cfg", "tox.ini"]:
-        p = path / candidate
-        if p.exists():
-            try:
-                if "pytest" in p.read_text():
-                    return True
-            except OSError:
-                pass
+    for candidate in ("pyproject.toml", "setup.cfg", "tox.ini"):
+        if candidate not in root_names:
+            continue
+        try:
+            with open(path / candidate, "rb") as fh:
+                # Carry the needle-length tail so a match spanning a chunk
+                # boundary is not missed.
+                tail = b""
+                while chunk := fh.read(65536):
+                    if b"pytest" in tail + chunk:
+                        return True
+                    tail = chunk[-5:]
+        except OSError:
+            pass
     return False
 
 
@@ -75,51 +213,51 @@ def check_repo_hygiene(repo_path: str) -> dict:
             "fail_closed": bool
         }
     """
-    path = Path(repo_path).resolve()
+    path = Path(_resolved(repo_path))
     checks: list[dict] = []
 
+    # One scandir pass per directory level instead of a stat per candidate.
+    root_names = _scan_names(path)
+    docs_names = _scan_names(path / "docs") if "docs" in root_names else set()
+
     # 1. pyproject.toml OR setup.cfg OR setup.py
-    pkg_candidates = ["pyproject.toml", "setup.cfg", "setup.py"]
-    found_pkg = next((f for f in pkg_candidates if (path / f).exists()), None)
+    found_pkg = next((f for f in _PKG_CANDIDATES if f in root_names), None)
     checks.append(
         {
             "check_id": "has_package_definition",
             "ok": found_pkg is not None,
             "details": f"Found {found_pkg}"
             if found_pkg
-            else f"Not found (checked: {', '.join(pkg_candidates)})",
+            else f"Not found (checked: {', '.join(_PKG_CANDIDATES)})",
         }
     )
 
     # 2. LICENSE
-    lic_candidates = ["LICENSE", "LICENSE.txt", "LICENSE.md", "LICENSE.rst"]
-    found_lic = next((f for f in lic_candidates if (path / f).exists()), None)
+    found_lic = next((f for f in _LICENSE_CANDIDATES if f in root_names), None)
     checks.append(
         {
             "check_id": "has_license",
             "ok": found_lic is not None,
             "details": f"Found {found_lic}"
             if found_lic
-            else f"Not found (checked: {', '.join(lic_candidates)})",
+            else f"Not found (checked: {', '.join(_LICENSE_CANDIDATES)})",
         }
     )
 
     # 3. README
-    readme_candidates = ["README.md", "README.rst", "README.txt", "README"]
-    found_readme = next((f for f in readme_candidates if (path / f).exists()), None)
+    found_readme = next((f for f in _README_CANDIDATES if f in root_names), None)
     checks.append(
         {
             "check_id": "has_readme",
             "ok": found_readme is not None,
             "details": f"Found {found_readme}"
             if found_readme
-            else f"Not found (checked: {', '.join(readme_candidates)})",
+            else f"Not found (checked: {', '.join(_README_CANDIDATES)})",
         }
     )
 
     # 4. .github/ISSUE_TEMPLATE/bug_report.yml
-    bug_yml = path / ".github" / "ISSUE_TEMPLATE" / "bug_report.yml"
-    bug_ok = bug_yml.exists()
+    bug_ok = _has_bug_template(path)
     checks.append(
         {
             "check_id": "has_bug_report_template",
@@ -131,8 +269,7 @@ def check_repo_hygiene(repo_path: str) -> dict:
     )
 
     # 5. .github/workflows/ directory (presence only)
-    workflows_dir = path / ".github" / "workflows"
-    wf_ok = workflows_dir.is_dir()
+    wf_ok = _has_ci_workflows(path)
     checks.append(
         {
             "check_id": "has_ci_workflows",
@@ -142,8 +279,7 @@ def check_repo_hygiene(repo_path: str) -> dict:
     )
 
     # 6. docs/V1_CONTRACT.md
-    contract_md = path / "docs" / "V1_CONTRACT.md"
-    contract_ok = contract_md.exists()
+    contract_ok = "V1_CONTRACT.md" in docs_names
     checks.append(
         {
             "check_id": "has_v1_contract",
@@ -153,8 +289,7 @@ def check_repo_hygiene(repo_path: str) -> dict:
     )
 
     # 7. docs/DETERMINISM_NOTES.md
-    det_md = path / "docs" / "DETERMINISM_NOTES.md"
-    det_ok = det_md.exists()
+    det_ok = "DETERMINISM_NOTES.md" in docs_names
     checks.append(
         {
             "check_id": "has_determinism_notes",
@@ -205,7 +340,7 @@ def check_version_alignment(
             "fail_closed": bool
         }
     """
-    path = Path(repo_path).resolve()
+    path = Path(_resolved(repo_path))
 
     detected_version = _detect_version(path)
     detected_source = "pyproject.toml" if detected_version is not None else None
@@ -243,6 +378,26 @@ def check_version_alignment(
     }
 
 
+@functools.lru_cache(maxsize=128)
+def _render_checklist(
+    target_tag: str,
+    test_cmd: str,
+    has_ci_workflows: bool,
+    has_bug_template: bool,
+) -> str:
+    """Render the checklist markdown from its deterministic inputs.
+
+    Pure function of its arguments, so the rendered string is cached and a
+    repeated checklist request against an unchanged repo is a dict lookup.
+    """
+    return _CHECKLIST_TEMPLATE.format(
+        tag=target_tag,
+        test_cmd=test_cmd,
+        bug_mark="✓ present" if has_bug_template else "✗ missing",
+        ci_mark="✓ present" if has_ci_workflows else "✗ missing",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tool: generate_release_checklist
 # ---------------------------------------------------------------------------
@@ -273,41 +428,20 @@ def generate_release_checklist(repo_path: str, target_tag: str) -> dict:
             "fail_closed": bool
         }
     """
-    path = Path(repo_path).resolve()
+    path = Path(_resolved(repo_path))
 
     detected_version = _detect_version(path)
-    has_ci_workflows = (path / ".github" / "workflows").is_dir()
-    has_bug_template = (path / ".github" / "ISSUE_TEMPLATE" / "bug_report.yml").exists()
+    has_ci_workflows = _has_ci_workflows(path)
+    has_bug_template = _has_bug_template(path)
     test_cmd = "pytest -q" if _has_pytest(path) else "run repo tests"
 
-    lines: list[str] = [
-        f"# Release Checklist — {target_tag}",
-        "",
-        "## Version alignment",
-        f"- [ ] Confirm version alignment: run `check_version_alignment` with `expected_tag={target_tag}`",
-        "",
-        "## Tests",
-        f"- [ ] Run tests: `{test_cmd}` — all must pass before tagging",
-        "",
-        "## Tag",
-        "- [ ] Create and push git tag:",
-        f"      `git tag {target_tag} && git push origin {target_tag}`",
-        "",
-        "## Release notes",
-        f"- [ ] Update CHANGELOG / release notes with entries for {target_tag}",
-        "",
-        "## Adoption hooks",
-        "- [ ] Verify adoption hooks are in place:",
-        f"  - Bug report template (.github/ISSUE_TEMPLATE/bug_report.yml): {'✓ present' if has_bug_template else '✗ missing'}",
-        f"  - CI workflows (.github/workflows/): {'✓ present' if has_ci_workflows else '✗ missing'}",
-        "  - Confirm pinned issues are set if applicable",
-    ]
-
     return {
         "tool": "generate_release_checklist",
         "repo_path": str(path),
         "target_tag": target_tag,
-        "checklist_markdown": "\n".join(lines),
+        "checklist_markdown": _render_checklist(
+            target_tag, test_cmd, has_ci_workflows, has_bug_template
+        ),
         "inputs_used": {
             "detected_version": detected_version,
             "has_ci_workflows": has_ci_workflows,
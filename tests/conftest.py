@@ -1,126 +1,138 @@
 # SPDX-License-Identifier: MIT
 """Pytest fixtures for mcp-release-guardian V1 tests.
 
-Plain-directory fixtures are used for hygiene, version, and checklist tools
-(none of those tools require a git repo).  The legacy clean_python_repo git
-fixture is retained for any future git-aware tests.
+All fixture repos are plain directories built in-process from the constants
+below via a spec-driven factory (no on-disk fixture assets and no git) —
+none of the V1 tools read anything beyond file presence and pyproject.toml.
+
+All fixtures here are session-scoped; under pytest-xdist "session" means
+per-worker session, which is fine: tmp_path_factory gives each worker its
+own base directory and the built variants are read-only after creation.
 """
 
 from __future__ import annotations
 
-import shutil
-import subprocess
 from pathlib import Path
 
 import pytest
 
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
-
-_PYPROJECT_WITH_VERSION = '[project]\nname = "test-pkg"\nversion = "0.1.0"\n'
+_PYPROJECT_WITH_VERSION = b'[project]\nname = "test-pkg"\nversion = "0.1.0"\n'
 _PYPROJECT_NO_VERSION = (
-    '[build-system]\nrequires = ["hatchling"]\nbuild-backend = "hatchling.build"\n'
+    b'[build-system]\nrequires = ["hatchling"]\nbuild-backend = "hatchling.build"\n'
 )
 
 
-# ---------------------------------------------------------------------------
-# Git helpers (kept for clean_python_repo)
-# ---------------------------------------------------------------------------
-
-
-def _git(args: list[str], cwd: Path) -> None:
-    subprocess.run(["git"] + args, cwd=cwd, check=True, capture_output=True)
-
-
-def _init_git_repo(path: Path) -> Path:
-    _git(["init"], path)
-    _git(["config", "user.email", "test@example.com"], path)
-    _git(["config", "user.name", "Test User"], path)
-    _git(["add", "."], path)
-    _git(["commit", "-m", "Initial commit"], path)
-    return path
-
-
 # ---------------------------------------------------------------------------
 # Plain-directory fixtures
 # ---------------------------------------------------------------------------
 
-
-@pytest.fixture(scope="session")
-def full_hygiene_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Directory containing all 7 V1 hygiene artifacts and version 0.1.0."""
-    base = tmp_path_factory.mktemp("full_hygiene_repo")
-    (base / "pyproject.toml").write_text(_PYPROJECT_WITH_VERSION)
-    (base / "README.md").write_text("# Test\n")
-    (base / "LICENSE").write_text("MIT License\n")
-    (base / ".github" / "ISSUE_TEMPLATE").mkdir(parents=True)
-    (base / ".github" / "ISSUE_TEMPLATE" / "bug_report.yml").write_text("name: Bug\n")
-    (base / ".github" / "workflows").mkdir(parents=True)
-    (base / ".github" / "workflows" / "ci.yml").write_text("name: CI\n")
-    (base / "docs").mkdir()
-    (base / "docs" / "V1_CONTRACT.md").write_text("# V1 Contract\n")
-    (base / "docs" / "DETERMINISM_NOTES.md").write_text("# Determinism Notes\n")
-    return base
+# Which artifacts each repo variant contains. _build_repo interprets these;
+# anything not listed is deliberately absent from the built tree.
+_SPECS: dict[str, frozenset[str]] = {
+    "full_hygiene": frozenset(
+        {"pyproject", "readme", "license", "bug_template", "ci", "v1_contract", "determinism"}
+    ),
+    "minimal": frozenset({"pyproject", "readme", "license"}),
+    "no_readme": frozenset({"pyproject", "license"}),
+    "no_license": frozenset({"pyproject", "readme"}),
+    "no_version": frozenset({"pyproject_no_version", "readme", "license"}),
+    "no_pyproject": frozenset({"readme", "license"}),
+    "clean_python": frozenset({"pyproject", "readme", "license", "changelog"}),
+}
+
+# File payloads as bytes, encoded once at import; _build_repo writes them
+# with write_bytes so no per-write UTF-8 encoding happens.
+_CHANGELOG = b"# Changelog\n\n## [0.1.0] - 2024-01-01\n\n- Initial release\n"
+_README = b"# Test\n"
+_LICENSE = b"MIT License\n"
+_BUG_TEMPLATE = b"name: Bug\n"
+_CI_WORKFLOW = b"name: CI\n"
+_V1_CONTRACT_DOC = b"# V1 Contract\n"
+_DETERMINISM_DOC = b"# Determinism Notes\n"
+
+
+def _build_repo(base: Path, spec: frozenset[str]) -> None:
+    """Materialize the artifacts named in spec under base."""
+    if "pyproject" in spec:
+        (base / "pyproject.toml").write_bytes(_PYPROJECT_WITH_VERSION)
+    if "pyproject_no_version" in spec:
+        (base / "pyproject.toml").write_bytes(_PYPROJECT_NO_VERSION)
+    if "readme" in spec:
+        (base / "README.md").write_bytes(_README)
+    if "license" in spec:
+        (base / "LICENSE").write_bytes(_LICENSE)
+    if "changelog" in spec:
+        (base / "CHANGELOG.md").write_bytes(_CHANGELOG)
+    if "bug_template" in spec:
+        (base / ".github" / "ISSUE_TEMPLATE").mkdir(parents=True)
+        (base / ".github" / "ISSUE_TEMPLATE" / "bug_report.yml").write_bytes(_BUG_TEMPLATE)
+    if "ci" in spec:
+        (base / ".github" / "workflows").mkdir(parents=True, exist_ok=True)
+        (base / ".github" / "workflows" / "ci.yml").write_bytes(_CI_WORKFLOW)
+    if "v1_contract" in spec or "determinism" in spec:
+        (base / "docs").mkdir()
+    if "v1_contract" in spec:
+        (base / "docs" / "V1_CONTRACT.md").write_bytes(_V1_CONTRACT_DOC)
+    if "determinism" in spec:
+        (base / "docs" / "DETERMINISM_NOTES.md").write_bytes(_DETERMINISM_DOC)
 
 
 @pytest.fixture(scope="session")
-def minimal_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Directory with only pyproject.toml, README, LICENSE.
-
-    Deliberately missing: .github/workflows/, .github/ISSUE_TEMPLATE/bug_report.yml,
-    docs/V1_CONTRACT.md, docs/DETERMINISM_NOTES.md.
+def repo_factory(tmp_path_factory: pytest.TempPathFactory):
+    """Session-scoped factory for variant repo directories.
+
+    Returns the variant's absolute path as a str — the canonical tool input —
+    so tests pass fixtures straight through without per-test str() calls.
+    Builds each variant at most once and only when a test actually asks for
+    it, so subset runs (-k) skip the setup I/O for unused variants. All
+    variants live under one numbered tmp dir: mktemp's numbered-dir scan of
+    $TMPDIR runs once per session instead of once per variant.
     """
-    base = tmp_path_factory.mktemp("minimal_repo")
-    (base / "pyproject.toml").write_text(_PYPROJECT_WITH_VERSION)
-    (base / "README.md").write_text("# Minimal\n")
-    (base / "LICENSE").write_text("MIT License\n")
-    return base
+    root = tmp_path_factory.mktemp("guardian")
+    built: dict[str, str] = {}
 
+    def _get(kind: str) -> str:
+        if kind not in built:
+            base = root / kind
+            base.mkdir()
+            _build_repo(base, _SPECS[kind])
+            built[kind] = str(base)
+        return built[kind]
 
-@pytest.fixture(scope="session")
-def no_readme_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Directory with pyproject.toml + LICENSE, missing any README file."""
-    base = tmp_path_factory.mktemp("no_readme_repo")
-    (base / "pyproject.toml").write_text(_PYPROJECT_WITH_VERSION)
-    (base / "LICENSE").write_text("MIT License\n")
-    return base
+    return _get
 
 
-@pytest.fixture(scope="session")
-def no_license_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Directory with pyproject.toml + README, missing any LICENSE file."""
-    base = tmp_path_factory.mktemp("no_license_repo")
-    (base / "pyproject.toml").write_text(_PYPROJECT_WITH_VERSION)
-    (base / "README.md").write_text("# No License\n")
-    return base
+# One-line summaries for the generated <kind>_repo fixtures; the authoritative
+# artifact lists live in _SPECS.
+_VARIANT_DOCS = {
+    "full_hygiene": "Directory containing all 7 V1 hygiene artifacts and version 0.1.0.",
+    "minimal": "Directory with only pyproject.toml, README, LICENSE.",
+    "no_readme": "Directory with pyproject.toml + LICENSE, missing any README file.",
+    "no_license": "Directory with pyproject.toml + README, missing any LICENSE file.",
+    "no_version": "Directory with pyproject.toml that has no [project].version field.",
+    "no_pyproject": "Directory with README + LICENSE but no pyproject.toml.",
+}
 
 
-@pytest.fixture(scope="session")
-def no_version_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Directory with pyproject.toml that has no [project].version field."""
-    base = tmp_path_factory.mktemp("no_version_repo")
-    (base / "pyproject.toml").write_text(_PYPROJECT_NO_VERSION)
-    (base / "README.md").write_text("# No Version\n")
-    (base / "LICENSE").write_text("MIT License\n")
-    return base
+def _variant_fixture(kind: str):
+    """Build the session-scoped <kind>_repo fixture deferring to repo_factory."""
 
+    def fixture_fn(repo_factory) -> str:
+        return repo_factory(kind)
 
-@pytest.fixture(scope="session")
-def no_pyproject_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Directory with README + LICENSE but no pyproject.toml."""
-    base = tmp_path_factory.mktemp("no_pyproject_repo")
-    (base / "README.md").write_text("# No Pyproject\n")
-    (base / "LICENSE").write_text("MIT License\n")
-    return base
+    fixture_fn.__doc__ = _VARIANT_DOCS[kind]
+    return pytest.fixture(scope="session", name=f"{kind}_repo")(fixture_fn)
 
 
-# ---------------------------------------------------------------------------
-# Git-repo fixture (seeded from tests/fixtures/clean_python/)
-# ---------------------------------------------------------------------------
+full_hygiene_repo = _variant_fixture("full_hygiene")
+minimal_repo = _variant_fixture("minimal")
+no_readme_repo = _variant_fixture("no_readme")
+no_license_repo = _variant_fixture("no_license")
+no_version_repo = _variant_fixture("no_version")
+no_pyproject_repo = _variant_fixture("no_pyproject")
 
 
 @pytest.fixture(scope="session")
-def clean_python_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    """Git repo seeded from fixtures/clean_python; pyproject.toml version = 0.1.0."""
-    base = tmp_path_factory.mktemp("clean_python_repo")
-    shutil.copytree(FIXTURES_DIR / "clean_python", base, dirs_exist_ok=True)
-    return _init_git_repo(base)
+def clean_python_repo(repo_factory) -> str:
+    """Clean project directory with a CHANGELOG; pyproject.toml version = 0.1.0."""
+    return repo_factory("clean_python")
@@ -8,8 +8,9 @@ input/output schemas without running the full server.
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import functools
+
+import pytest
 
 from mcp_release_guardian.server import (
     check_repo_hygiene,
@@ -37,9 +38,51 @@ V1_CHECK_IDS = [
 ]
 
 
-def _stable_json(obj: object) -> str:
-    """Stable JSON string with sorted keys for determinism comparisons."""
-    return json.dumps(obj, sort_keys=True)
+# ---------------------------------------------------------------------------
+# Cached tool invocations
+# ---------------------------------------------------------------------------
+#
+# Fixtures are session-scoped and never mutated, so most tests can share one
+# result per distinct input instead of re-running the tool (and its stat
+# traffic) per assertion. The determinism tests intentionally bypass these
+# helpers and call the tools directly. No test mutates a result dict.
+
+
+@functools.lru_cache(maxsize=None)
+def _hygiene(path: str) -> dict:
+    return check_repo_hygiene(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _version(path: str, expected_tag: str | None = None) -> dict:
+    return check_version_alignment(path, expected_tag)
+
+
+@functools.lru_cache(maxsize=None)
+def _checklist(path: str, target_tag: str) -> dict:
+    return generate_release_checklist(path, target_tag)
+
+
+def _checks_by_id(result: dict) -> dict[str, dict]:
+    """Index a hygiene result's checks by check_id (one pass, then O(1) lookups)."""
+    return {c["check_id"]: c for c in result["checks"]}
+
+
+def _assert_jsonable(obj: object) -> None:
+    """Recursively assert obj contains only JSON-representable types.
+
+    Equivalent guard to a json.dumps/loads round trip, but a single tree
+    walk with no serialization or reparsing.
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            assert isinstance(key, str)
+            _assert_jsonable(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            _assert_jsonable(item)
+    else:
+        assert isinstance(obj, (str, int, float, bool, type(None)))
 
 
 # ---------------------------------------------------------------------------
@@ -51,143 +94,105 @@ class TestCheckRepoHygiene:
 
     # --- schema ---
 
-    def test_top_level_keys(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
+    def test_top_level_keys(self, full_hygiene_repo: str) -> None:
+        result = _hygiene(full_hygiene_repo)
         assert set(result.keys()) == {"tool", "repo_path", "ok", "checks", "fail_closed"}
 
-    def test_tool_field_value(self, full_hygiene_repo: Path) -> None:
-        assert check_repo_hygiene(str(full_hygiene_repo))["tool"] == _TOOL_HYGIENE
+    def test_tool_field_value(self, full_hygiene_repo: str) -> None:
+        assert _hygiene(full_hygiene_repo)["tool"] == _TOOL_HYGIENE
 
-    def test_check_item_keys(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
+    def test_check_item_keys(self, full_hygiene_repo: str) -> None:
+        result = _hygiene(full_hygiene_repo)
         for check in result["checks"]:
             assert set(check.keys()) == {"check_id", "ok", "details"}
-            assert isinstance(check["check_id"], str)
-            assert isinstance(check["ok"], bool)
-            assert isinstance(check["details"], str)
 
-    def test_repo_path_is_resolved_absolute(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        assert Path(result["repo_path"]).is_absolute()
-        assert result["repo_path"] == str(full_hygiene_repo)
+    @pytest.mark.parametrize(
+        ("field", "typ"), [("check_id", str), ("ok", bool), ("details", str)]
+    )
+    def test_check_item_field_types(
+        self, full_hygiene_repo: str, field: str, typ: type
+    ) -> None:
+        result = _hygiene(full_hygiene_repo)
+        assert all(isinstance(c[field], typ) for c in result["checks"])
 
-    # --- check count and IDs ---
+    def test_repo_path_echoes_resolved_input(self, full_hygiene_repo: str) -> None:
+        # The fixture path is already absolute and resolved, so equality with
+        # it also covers the absoluteness guarantee _resolved() provides.
+        assert _hygiene(full_hygiene_repo)["repo_path"] == full_hygiene_repo
 
-    def test_exactly_seven_checks(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        assert len(result["checks"]) == 7
+    # --- check count and IDs ---
 
-    def test_check_ids_match_contract_in_order(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
+    def test_check_ids_match_contract_in_order(self, full_hygiene_repo: str) -> None:
+        # List equality covers count (exactly 7) and order in one comparison
+        result = _hygiene(full_hygiene_repo)
         assert [c["check_id"] for c in result["checks"]] == V1_CHECK_IDS
 
     # --- ok / fail_closed semantics ---
 
-    def test_all_checks_present_ok_true(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
+    def test_all_checks_present_ok_true(self, full_hygiene_repo: str) -> None:
+        result = _hygiene(full_hygiene_repo)
         assert result["ok"] is True
         assert result["fail_closed"] is False
 
-    def test_missing_artifacts_ok_false(self, minimal_repo: Path) -> None:
+    def test_missing_artifacts_ok_false(self, minimal_repo: str) -> None:
         # minimal_repo lacks workflows, docs, and bug template
-        result = check_repo_hygiene(str(minimal_repo))
+        result = _hygiene(minimal_repo)
         assert result["ok"] is False
         assert result["fail_closed"] is True
 
-    def test_fail_closed_equals_not_ok(self, full_hygiene_repo: Path, minimal_repo: Path) -> None:
+    def test_fail_closed_equals_not_ok(self, full_hygiene_repo: str, minimal_repo: str) -> None:
         for path in (full_hygiene_repo, minimal_repo):
-            r = check_repo_hygiene(str(path))
+            r = _hygiene(path)
             assert r["fail_closed"] is (not r["ok"])
 
     # --- individual check correctness ---
 
-    def test_has_readme_false_when_missing(self, no_readme_repo: Path) -> None:
-        result = check_repo_hygiene(str(no_readme_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_readme")
-        assert check["ok"] is False
+    _PRESENT_CASES = [
+        ("minimal_repo", "has_package_definition"),
+        ("minimal_repo", "has_license"),
+        ("minimal_repo", "has_readme"),
+        ("full_hygiene_repo", "has_bug_report_template"),
+        ("full_hygiene_repo", "has_ci_workflows"),
+        ("full_hygiene_repo", "has_v1_contract"),
+        ("full_hygiene_repo", "has_determinism_notes"),
+    ]
+
+    _ABSENT_CASES = [
+        ("no_pyproject_repo", "has_package_definition"),
+        ("no_license_repo", "has_license"),
+        ("no_readme_repo", "has_readme"),
+        ("minimal_repo", "has_bug_report_template"),
+        ("minimal_repo", "has_ci_workflows"),
+        ("minimal_repo", "has_v1_contract"),
+        ("minimal_repo", "has_determinism_notes"),
+    ]
+
+    @pytest.mark.parametrize(("fixture_name", "check_id"), _PRESENT_CASES)
+    def test_check_ok_when_artifact_present(
+        self, request: pytest.FixtureRequest, fixture_name: str, check_id: str
+    ) -> None:
+        result = _hygiene(request.getfixturevalue(fixture_name))
+        assert _checks_by_id(result)[check_id]["ok"] is True
+
+    @pytest.mark.parametrize(("fixture_name", "check_id"), _ABSENT_CASES)
+    def test_check_fails_when_artifact_missing(
+        self, request: pytest.FixtureRequest, fixture_name: str, check_id: str
+    ) -> None:
+        result = _hygiene(request.getfixturevalue(fixture_name))
+        assert _checks_by_id(result)[check_id]["ok"] is False
+        # Any failing check must fail the repo overall
         assert result["ok"] is False
 
-    def test_has_readme_true_when_present(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_readme")
-        assert check["ok"] is True
-
-    def test_has_license_false_when_missing(self, no_license_repo: Path) -> None:
-        result = check_repo_hygiene(str(no_license_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_license")
-        assert check["ok"] is False
-        assert result["ok"] is False
-
-    def test_has_license_true_when_present(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_license")
-        assert check["ok"] is True
-
-    def test_has_bug_report_template_true(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_bug_report_template")
-        assert check["ok"] is True
-
-    def test_has_bug_report_template_false(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_bug_report_template")
-        assert check["ok"] is False
-
-    def test_has_ci_workflows_true(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_ci_workflows")
-        assert check["ok"] is True
-
-    def test_has_ci_workflows_false(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_ci_workflows")
-        assert check["ok"] is False
-
-    def test_has_v1_contract_true(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_v1_contract")
-        assert check["ok"] is True
-
-    def test_has_v1_contract_false(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_v1_contract")
-        assert check["ok"] is False
-
-    def test_has_determinism_notes_true(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_determinism_notes")
-        assert check["ok"] is True
-
-    def test_has_determinism_notes_false(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_determinism_notes")
-        assert check["ok"] is False
-
-    def test_has_package_definition_true(self, minimal_repo: Path) -> None:
-        result = check_repo_hygiene(str(minimal_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_package_definition")
-        assert check["ok"] is True
-
-    def test_has_package_definition_false(self, no_pyproject_repo: Path) -> None:
-        result = check_repo_hygiene(str(no_pyproject_repo))
-        check = next(c for c in result["checks"] if c["check_id"] == "has_package_definition")
-        assert check["ok"] is False
-
     # --- serialisability and determinism ---
 
-    def test_json_serializable(self, full_hygiene_repo: Path) -> None:
-        result = check_repo_hygiene(str(full_hygiene_repo))
-        assert json.loads(json.dumps(result)) == result
+    def test_json_serializable(self, full_hygiene_repo: str) -> None:
+        _assert_jsonable(_hygiene(full_hygiene_repo))
 
-    def test_deterministic(self, full_hygiene_repo: Path) -> None:
-        r1 = check_repo_hygiene(str(full_hygiene_repo))
-        r2 = check_repo_hygiene(str(full_hygiene_repo))
-        assert _stable_json(r1) == _stable_json(r2)
+    def test_deterministic(self, full_hygiene_repo: str) -> None:
+        assert check_repo_hygiene(full_hygiene_repo) == _hygiene(full_hygiene_repo)
 
-    def test_deterministic_on_failing_repo(self, minimal_repo: Path) -> None:
-        r1 = check_repo_hygiene(str(minimal_repo))
-        r2 = check_repo_hygiene(str(minimal_repo))
-        assert _stable_json(r1) == _stable_json(r2)
+    def test_deterministic_on_failing_repo(self, minimal_repo: str) -> None:
+        assert check_repo_hygiene(minimal_repo) == _hygiene(minimal_repo)
 
 
 # ---------------------------------------------------------------------------
@@ -197,97 +202,74 @@ class TestCheckRepoHygiene:
 
 class TestCheckVersionAlignment:
 
-    # --- schema ---
+    # --- schema and matched-tag semantics (one call, one block of invariants) ---
 
-    def test_top_level_keys(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
+    def test_schema_and_match_semantics(self, clean_python_repo: str) -> None:
+        result = _version(clean_python_repo, "v0.1.0")
         assert set(result.keys()) == {
             "tool", "repo_path", "ok", "expected_tag", "detected", "details", "fail_closed",
         }
-
-    def test_tool_field_value(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
         assert result["tool"] == _TOOL_VERSION
-
-    def test_detected_keys(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
+        assert result["repo_path"] == clean_python_repo
+        assert result["expected_tag"] == "v0.1.0"
         assert set(result["detected"].keys()) == {"version", "source"}
-
-    def test_details_is_non_empty_string(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
         assert isinstance(result["details"], str) and result["details"]
-
-    def test_repo_path_is_resolved_absolute(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
-        assert Path(result["repo_path"]).is_absolute()
-
-    # --- ok / fail_closed semantics ---
-
-    def test_matching_tag_ok_true(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
+        # Matching tag: detected from pyproject, ok, not fail-closed
+        assert result["detected"]["version"] == "0.1.0"
+        assert result["detected"]["source"] == "pyproject.toml"
         assert result["ok"] is True
         assert result["fail_closed"] is False
 
-    def test_version_detected_from_pyproject(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
-        assert result["detected"]["version"] == "0.1.0"
-        assert result["detected"]["source"] == "pyproject.toml"
+    # --- ok / fail_closed semantics ---
 
-    def test_leading_v_stripped_before_comparison(self, clean_python_repo: Path) -> None:
+    def test_leading_v_stripped_before_comparison(self, clean_python_repo: str) -> None:
         # "v0.1.0" normalises to "0.1.0" which matches pyproject version "0.1.0"
-        assert check_version_alignment(str(clean_python_repo), "v0.1.0")["ok"] is True
+        assert _version(clean_python_repo, "v0.1.0")["ok"] is True
         # Same result without leading v
-        assert check_version_alignment(str(clean_python_repo), "0.1.0")["ok"] is True
+        assert _version(clean_python_repo, "0.1.0")["ok"] is True
 
-    def test_expected_tag_echoed_in_output(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
-        assert result["expected_tag"] == "v0.1.0"
-
-    def test_tag_mismatch_ok_false_fail_closed_false(self, clean_python_repo: Path) -> None:
+    def test_tag_mismatch_ok_false_fail_closed_false(self, clean_python_repo: str) -> None:
         # Version IS detected; mismatch is not a fail-closed event
-        result = check_version_alignment(str(clean_python_repo), "v9.9.9")
+        result = _version(clean_python_repo, "v9.9.9")
         assert result["ok"] is False
         assert result["fail_closed"] is False
 
-    def test_missing_version_ok_false_fail_closed_true(self, no_version_repo: Path) -> None:
-        result = check_version_alignment(str(no_version_repo), "v0.1.0")
+    def test_missing_version_ok_false_fail_closed_true(self, no_version_repo: str) -> None:
+        result = _version(no_version_repo, "v0.1.0")
         assert result["ok"] is False
         assert result["fail_closed"] is True
         assert result["detected"]["version"] is None
         assert result["detected"]["source"] is None
 
-    def test_no_pyproject_ok_false_fail_closed_true(self, no_pyproject_repo: Path) -> None:
-        result = check_version_alignment(str(no_pyproject_repo), "v0.1.0")
+    def test_no_pyproject_ok_false_fail_closed_true(self, no_pyproject_repo: str) -> None:
+        result = _version(no_pyproject_repo, "v0.1.0")
         assert result["ok"] is False
         assert result["fail_closed"] is True
         assert result["detected"]["version"] is None
 
-    def test_no_expected_tag_ok_true_when_version_present(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo))
+    def test_no_expected_tag_ok_true_when_version_present(self, clean_python_repo: str) -> None:
+        result = _version(clean_python_repo)
         assert result["ok"] is True
         assert result["expected_tag"] is None
         assert result["fail_closed"] is False
 
-    def test_no_expected_tag_fail_closed_when_version_absent(self, no_pyproject_repo: Path) -> None:
-        result = check_version_alignment(str(no_pyproject_repo))
+    def test_no_expected_tag_fail_closed_when_version_absent(self, no_pyproject_repo: str) -> None:
+        result = _version(no_pyproject_repo)
         assert result["ok"] is False
         assert result["fail_closed"] is True
 
     # --- serialisability and determinism ---
 
-    def test_json_serializable(self, clean_python_repo: Path) -> None:
-        result = check_version_alignment(str(clean_python_repo), "v0.1.0")
-        assert json.loads(json.dumps(result)) == result
+    def test_json_serializable(self, clean_python_repo: str) -> None:
+        _assert_jsonable(_version(clean_python_repo, "v0.1.0"))
 
-    def test_deterministic(self, clean_python_repo: Path) -> None:
-        r1 = check_version_alignment(str(clean_python_repo), "v0.1.0")
-        r2 = check_version_alignment(str(clean_python_repo), "v0.1.0")
-        assert _stable_json(r1) == _stable_json(r2)
+    def test_deterministic(self, clean_python_repo: str) -> None:
+        fresh = check_version_alignment(clean_python_repo, "v0.1.0")
+        assert fresh == _version(clean_python_repo, "v0.1.0")
 
-    def test_deterministic_fail_closed(self, no_pyproject_repo: Path) -> None:
-        r1 = check_version_alignment(str(no_pyproject_repo), "v0.1.0")
-        r2 = check_version_alignment(str(no_pyproject_repo), "v0.1.0")
-        assert _stable_json(r1) == _stable_json(r2)
+    def test_deterministic_fail_closed(self, no_pyproject_repo: str) -> None:
+        fresh = check_version_alignment(no_pyproject_repo, "v0.1.0")
+        assert fresh == _version(no_pyproject_repo, "v0.1.0")
 
 
 # ---------------------------------------------------------------------------
@@ -297,116 +279,95 @@ class TestCheckVersionAlignment:
 
 class TestGenerateReleaseChecklist:
 
-    # --- schema ---
+    # --- schema (one call, one block of invariants) ---
 
-    def test_top_level_keys(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
+    def test_schema(self, clean_python_repo: str) -> None:
+        result = _checklist(clean_python_repo, "v0.1.0")
         assert set(result.keys()) == {
             "tool", "repo_path", "target_tag",
             "checklist_markdown", "inputs_used", "fail_closed",
         }
-
-    def test_tool_field_value(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
         assert result["tool"] == _TOOL_CHECKLIST
-
-    def test_inputs_used_keys(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
+        assert result["repo_path"] == clean_python_repo
+        assert result["target_tag"] == "v0.1.0"
         assert set(result["inputs_used"].keys()) == {
             "detected_version", "has_ci_workflows", "has_bug_template",
         }
-
-    def test_inputs_used_boolean_types(self, clean_python_repo: Path) -> None:
-        iu = generate_release_checklist(str(clean_python_repo), "v0.1.0")["inputs_used"]
-        assert isinstance(iu["has_ci_workflows"], bool)
-        assert isinstance(iu["has_bug_template"], bool)
-
-    def test_target_tag_echoed_in_output(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
-        assert result["target_tag"] == "v0.1.0"
-
-    def test_repo_path_is_resolved_absolute(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
-        assert Path(result["repo_path"]).is_absolute()
-
-    def test_checklist_markdown_is_non_empty_string(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
+        assert isinstance(result["inputs_used"]["has_ci_workflows"], bool)
+        assert isinstance(result["inputs_used"]["has_bug_template"], bool)
         assert isinstance(result["checklist_markdown"], str)
         assert len(result["checklist_markdown"]) > 0
 
     # --- required checklist content ---
 
-    def test_target_tag_stamped_in_markdown(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.2.0")
+    def test_target_tag_stamped_in_markdown(self, clean_python_repo: str) -> None:
+        result = _checklist(clean_python_repo, "v0.2.0")
         assert "v0.2.0" in result["checklist_markdown"]
 
-    def test_contains_version_alignment_step(self, clean_python_repo: Path) -> None:
-        md = generate_release_checklist(str(clean_python_repo), "v0.1.0")["checklist_markdown"]
+    def test_contains_version_alignment_step(self, clean_python_repo: str) -> None:
+        md = _checklist(clean_python_repo, "v0.1.0")["checklist_markdown"]
         assert "version alignment" in md.lower() or "check_version_alignment" in md
 
-    def test_contains_test_run_step(self, clean_python_repo: Path) -> None:
-        md = generate_release_checklist(str(clean_python_repo), "v0.1.0")["checklist_markdown"]
+    def test_contains_test_run_step(self, clean_python_repo: str) -> None:
+        md = _checklist(clean_python_repo, "v0.1.0")["checklist_markdown"]
         assert "test" in md.lower()
 
-    def test_contains_tag_step(self, clean_python_repo: Path) -> None:
-        md = generate_release_checklist(str(clean_python_repo), "v0.1.0")["checklist_markdown"]
+    def test_contains_tag_step(self, clean_python_repo: str) -> None:
+        md = _checklist(clean_python_repo, "v0.1.0")["checklist_markdown"]
         assert "git tag" in md
 
-    def test_contains_release_notes_step(self, clean_python_repo: Path) -> None:
-        md = generate_release_checklist(str(clean_python_repo), "v0.1.0")["checklist_markdown"]
+    def test_contains_release_notes_step(self, clean_python_repo: str) -> None:
+        md = _checklist(clean_python_repo, "v0.1.0")["checklist_markdown"]
         assert "release notes" in md.lower() or "changelog" in md.lower()
 
-    def test_contains_adoption_hooks_step(self, clean_python_repo: Path) -> None:
-        md = generate_release_checklist(str(clean_python_repo), "v0.1.0")["checklist_markdown"]
+    def test_contains_adoption_hooks_step(self, clean_python_repo: str) -> None:
+        md = _checklist(clean_python_repo, "v0.1.0")["checklist_markdown"]
         assert any(kw in md.lower() for kw in ("adoption", "hooks", "bug"))
 
     # --- fail_closed ---
 
-    def test_fail_closed_false_when_version_detected(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
+    def test_fail_closed_false_when_version_detected(self, clean_python_repo: str) -> None:
+        result = _checklist(clean_python_repo, "v0.1.0")
         assert result["fail_closed"] is False
         assert result["inputs_used"]["detected_version"] == "0.1.0"
 
-    def test_fail_closed_true_when_version_undetectable(self, no_pyproject_repo: Path) -> None:
-        result = generate_release_checklist(str(no_pyproject_repo), "v0.1.0")
+    def test_fail_closed_true_when_version_undetectable(self, no_pyproject_repo: str) -> None:
+        result = _checklist(no_pyproject_repo, "v0.1.0")
         assert result["fail_closed"] is True
         assert result["inputs_used"]["detected_version"] is None
 
-    def test_fail_closed_true_when_no_project_version(self, no_version_repo: Path) -> None:
-        result = generate_release_checklist(str(no_version_repo), "v0.1.0")
+    def test_fail_closed_true_when_no_project_version(self, no_version_repo: str) -> None:
+        result = _checklist(no_version_repo, "v0.1.0")
         assert result["fail_closed"] is True
         assert result["inputs_used"]["detected_version"] is None
 
     # --- inputs_used booleans reflect local presence ---
 
-    def test_has_ci_workflows_true(self, full_hygiene_repo: Path) -> None:
-        result = generate_release_checklist(str(full_hygiene_repo), "v0.1.0")
+    def test_has_ci_workflows_true(self, full_hygiene_repo: str) -> None:
+        result = _checklist(full_hygiene_repo, "v0.1.0")
         assert result["inputs_used"]["has_ci_workflows"] is True
 
-    def test_has_ci_workflows_false(self, minimal_repo: Path) -> None:
-        result = generate_release_checklist(str(minimal_repo), "v0.1.0")
+    def test_has_ci_workflows_false(self, minimal_repo: str) -> None:
+        result = _checklist(minimal_repo, "v0.1.0")
         assert result["inputs_used"]["has_ci_workflows"] is False
 
-    def test_has_bug_template_true(self, full_hygiene_repo: Path) -> None:
-        result = generate_release_checklist(str(full_hygiene_repo), "v0.1.0")
+    def test_has_bug_template_true(self, full_hygiene_repo: str) -> None:
+        result = _checklist(full_hygiene_repo, "v0.1.0")
         assert result["inputs_used"]["has_bug_template"] is True
 
-    def test_has_bug_template_false(self, minimal_repo: Path) -> None:
-        result = generate_release_checklist(str(minimal_repo), "v0.1.0")
+    def test_has_bug_template_false(self, minimal_repo: str) -> None:
+        result = _checklist(minimal_repo, "v0.1.0")
         assert result["inputs_used"]["has_bug_template"] is False
 
     # --- serialisability and determinism ---
 
-    def test_json_serializable(self, clean_python_repo: Path) -> None:
-        result = generate_release_checklist(str(clean_python_repo), "v0.1.0")
-        assert json.loads(json.dumps(result)) == result
+    def test_json_serializable(self, clean_python_repo: str) -> None:
+        _assert_jsonable(_checklist(clean_python_repo, "v0.1.0"))
 
-    def test_deterministic_same_inputs(self, clean_python_repo: Path) -> None:
-        r1 = generate_release_checklist(str(clean_python_repo), "v0.1.0")
-        r2 = generate_release_checklist(str(clean_python_repo), "v0.1.0")
-        assert _stable_json(r1) == _stable_json(r2)
+    def test_deterministic_same_inputs(self, clean_python_repo: str) -> None:
+        fresh = generate_release_checklist(clean_python_repo, "v0.1.0")
+        assert fresh == _checklist(clean_python_repo, "v0.1.0")
 
-    def test_deterministic_fail_closed(self, no_pyproject_repo: Path) -> None:
-        r1 = generate_release_checklist(str(no_pyproject_repo), "v0.1.0")
-        r2 = generate_release_checklist(str(no_pyproject_repo), "v0.1.0")
-        assert _stable_json(r1) == _stable_json(r2)
+    def test_deterministic_fail_closed(self, no_pyproject_repo: str) -> None:
+        fresh = generate_release_checklist(no_pyproject_repo, "v0.1.0")
+        assert fresh == _checklist(no_pyproject_repo, "v0.1.0")